@@ -1,10 +1,103 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import asyncio
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 import os
+import tempfile
+import logging
 from dotenv import load_dotenv
 
+logger = logging.getLogger("naukri")
+
+
+class CappedRetry(Retry):
+    """
+    urllib3 Retry that never sleeps longer than RETRY_AFTER_CAP for a Retry-After
+    header. 429s are never retried here; NaukriAPIClient._send hands them to the
+    client-side rate limiter instead.
+    """
+
+    RETRY_AFTER_CAP = 30
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_CAP)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to throttle requests client-side.
+    The refill rate adapts to the server: a 429 with Retry-After pauses the
+    bucket and lowers the rate, successful calls slowly restore it.
+    """
+
+    def __init__(self, rate, capacity):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._blocked_until = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttled(self, retry_after):
+        """Server rejected us: hold off for retry_after seconds and slow down."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            self._tokens = 0
+            self.rate = min(self.rate, 1 / max(retry_after, 1))
+
+    def succeeded(self):
+        """Server accepted us: creep the rate back towards its baseline."""
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate * 1.5)
+
+
+@dataclass
+class ProfileView:
+    """Fields read from the profile payload, parsed once per fetch."""
+
+    profile_id: str = None
+    headline: str = None
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_json(cls, data):
+        """Build a view from the /users/self response."""
+        profile_list = data.get("profile") or [{}]
+        profile = profile_list[0]
+        return cls(
+            profile_id=profile.get("profileId"),
+            headline=profile.get("resumeHeadline"),
+            raw=data,
+        )
+
 
 class NaukriAPIClient:
     """
@@ -13,6 +106,18 @@ class NaukriAPIClient:
     Uses JSON files for credentials and cookies.
     """
 
+    # Client-side rate limits per endpoint family as (requests/sec, burst).
+    # Shared by every client in the process, since batch mode drives many
+    # accounts from the same IP.
+    _rate_limits = {
+        "login": TokenBucket(rate=0.2, capacity=2),
+        "profile": TokenBucket(rate=2, capacity=5),
+        "update": TokenBucket(rate=1, capacity=2),
+        "upload": TokenBucket(rate=1, capacity=2),
+    }
+    # Attempts per call when the server keeps answering 429
+    _max_throttled_attempts = 5
+
     def __init__(
         self,
         username: str = None,
@@ -35,12 +140,88 @@ class NaukriAPIClient:
         self.session = requests.Session()
         self.cookie_file = Path(cookie_file)
 
-        # Default headers required by Naukri
+        # Endpoint URLs, built once per client
+        resman = f"{self.base_url}/cloudgateway-mynaukri/resman-aggregator-services"
+        self._url_login = f"{self.base_url}/central-login-services/v1/login"
+        self._url_profile = f"{resman}/v2/users/self?expand_level=4"
+        self._url_fullprofiles = f"{resman}/v1/users/self/fullprofiles"
+        self._url_adv_resume_tmpl = f"{resman}/v0/users/self/profiles/{{pid}}/advResume"
+        self._url_file_upload = "https://filevalidation.naukri.com/file"
+
+        # Back off on transient server errors, honouring Retry-After (capped
+        # at 30s, like the exponential backoff). 429s are left to the token
+        # buckets. POST is safe to replay on this adapter: login only
+        # re-issues cookies and the profile updates are PUT overrides. The
+        # file upload POST is not (every replay stores another file), so it
+        # gets its own adapter below.
+        retry = CappedRetry(
+            total=5,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            backoff_max=30,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # Pool keep-alive connections so repeated calls don't pay a fresh
+        # TLS handshake each time
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=20, pool_block=False, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # The upload only retries connection failures, i.e. before anything
+        # reached the server; read errors and 5xx are returned to the caller
+        upload_retry = CappedRetry(
+            total=3,
+            connect=3,
+            read=False,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            backoff_max=30,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        self.session.mount(
+            self._url_file_upload,
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=upload_retry),
+        )
+
+        # Default headers required by Naukri, installed on the session so
+        # call sites only pass per-endpoint overrides. JSON bodies are
+        # encoded with orjson and sent as data=, relying on this Content-Type.
         self.headers = {
             "appid": "103",
             "systemid": "jobseeker",
             "Content-Type": "application/json",
         }
+        self.session.headers.update(self.headers)
+        self.session.headers["Connection"] = "keep-alive"
+
+        # In-memory ProfileView cache (profileId is stable within a session)
+        self._profile_cache = None
+        self._profile_cache_ts = 0
+        self._profile_cache_ttl = 300
+
+        # Harvested from the first successful profile fetch; stable until logout
+        self.profile_id = None
+        self.resume_headline = None
+
+        # Earliest expiry among saved cookies (0 = none), so expiry checks
+        # don't hit the disk
+        self._cookie_expiry_min = 0
+
+        # Requests treat cookies as expired this many seconds early. A
+        # background timer re-logs in a further margin ahead of that, so
+        # request paths never pay for it, but only while the client is in use.
+        self._refresh_margin = 120
+        self._refresh_timer = None
+        self._used_since_refresh = False
+        # Serialises login() between the timer thread and request paths
+        self._login_lock = threading.RLock()
 
         self._load_cookies()
 
@@ -49,57 +230,94 @@ class NaukriAPIClient:
     # ----------------------------------------------------------------
     def login(self):
         """Login to Naukri and store cookies."""
-        login_url = f"{self.base_url}/central-login-services/v1/login"
         payload = {"username": self.username, "password": self.password}
 
-        print("Logging in...")
-        resp = self.session.post(login_url, headers=self.headers, json=payload)
-        resp.raise_for_status()
-        data = resp.json()
+        with self._login_lock:
+            logger.info("Logging in...")
+            resp = self._request("login", "POST", self._url_login, data=orjson.dumps(payload))
+            data = self._json(resp)
 
-        if "cookies" not in data:
-            raise ValueError("❌ Login response does not contain cookies")
+            if "cookies" not in data:
+                raise ValueError("❌ Login response does not contain cookies")
 
-        self._set_cookies_from_json(data["cookies"])
-        self._save_cookies()
-        print("Login successful. Cookies saved.")
+            self._set_cookies_from_json(data["cookies"])
+            self._save_cookies()
+            self._invalidate_profile_cache()
+            logger.info("Login successful. Cookies saved.")
 
     def logout(self):
         """Clear cookies and session."""
-        self.session.cookies.clear()
-        if self.cookie_file.exists():
-            self.cookie_file.unlink()
-        print("Logged out and cleared cookies.")
+        # Under the login lock so an in-flight background login can't
+        # recreate the cookie file or re-arm its timer afterwards
+        with self._login_lock:
+            self.session.cookies.clear()
+            self._cookie_expiry_min = 0
+            self._cancel_cookie_refresh()
+            self._used_since_refresh = False
+            self.profile_id = None
+            self.resume_headline = None
+            self._invalidate_profile_cache()
+            if self.cookie_file.exists():
+                self.cookie_file.unlink()
+        logger.info("Logged out and cleared cookies.")
+
+    def close(self):
+        """Stop the background cookie refresh and release pooled connections."""
+        with self._login_lock:
+            self._cancel_cookie_refresh()
+        self.session.close()
 
     # ----------------------------------------------------------------
     # BUSINESS / FEATURE METHODS
     # ----------------------------------------------------------------
-    def get_profile(self):
+    def get_profile(self, force_refresh=False):
         """
         Fetch logged-in user's profile details.
+        Served from an in-memory cache for a few minutes unless force_refresh is set.
         Returns dict if successful, else None.
         """
+        view = self.get_profile_view(force_refresh=force_refresh)
+        return view.raw if view else None
 
-        url = f"{self.base_url}/cloudgateway-mynaukri/resman-aggregator-services/v2/users/self?expand_level=4"
+    def get_profile_view(self, force_refresh=False):
+        """
+        Same as get_profile(), but returns a ProfileView with the commonly used
+        fields already extracted. Returns None on failure.
+        """
+
+        if (
+            not force_refresh
+            and self._profile_cache is not None
+            and time.time() - self._profile_cache_ts < self._profile_cache_ttl
+        ):
+            return self._profile_cache
 
-        # Refresh cookies if expired
+        # Refresh cookies if expired (re-checked under the lock in case the
+        # background refresh got there first)
         if self._is_cookie_expired():
-            self.login()
+            with self._login_lock:
+                if self._is_cookie_expired():
+                    self.login()
 
         try:
-            resp = self.session.get(url, headers=self.headers)
+            resp = self._request("profile", "GET", self._url_profile)
             if resp.status_code == 401:
-                print("Unauthorized. Re-logging in...")
+                logger.warning("Unauthorized. Re-logging in...")
                 self.login()
-                resp = self.session.get(url, headers=self.headers)
+                resp = self._request("profile", "GET", self._url_profile)
 
             if resp.status_code == 200:
-                return resp.json()
+                view = ProfileView.from_json(self._json(resp))
+                self._profile_cache = view
+                self._profile_cache_ts = time.time()
+                self.profile_id = view.profile_id or self.profile_id
+                self.resume_headline = view.headline
+                return view
             else:
-                print(f"Failed to fetch profile: {resp.status_code}")
+                logger.warning("Failed to fetch profile: %s", resp.status_code)
                 return None
         except Exception as e:
-            print(f"Exception while fetching profile: {e}")
+            logger.error("Exception while fetching profile: %s", e)
             return None
         
     def upload_resume(self, file_path):
@@ -113,8 +331,6 @@ class NaukriAPIClient:
             str | None: The file key if upload successful, else None.
         """
 
-        url = "https://filevalidation.naukri.com/file"
-
         # Static form fields (as per your configuration)
         data = {
             "formKey": "F51f8e7e54e205",
@@ -123,43 +339,51 @@ class NaukriAPIClient:
         }
 
         # Required headers for this upload API
+        # (Content-Type is dropped so requests sets the multipart boundary)
         headers = {
             "appid": "105",
             "systemid": "fileupload",
+            "Content-Type": None,
         }
 
         try:
-            with open(file_path, "rb") as f:
+            with open(file_path, "rb") as f, ThreadPoolExecutor(max_workers=1) as executor:
+                # profileId only needs fetching once per session; when it is
+                # unknown, overlap the profile fetch with the upload
+                profile_future = None
+                if self.profile_id is None:
+                    profile_future = executor.submit(self.get_profile_view)
+
                 files = {"file": (Path(file_path).name, f)}
 
-                print(f"Uploading file: {file_path}")
-                response = self.session.post(url, headers=headers, files=files, data=data)
-                response.raise_for_status()
+                logger.info("Uploading file: %s", file_path)
+                response = self._request("upload", "POST", self._url_file_upload, headers=headers, files=files, data=data)
 
                 # Expect JSON like:
                 # { "UR54EQmIiGvBMt": { "url": "//filevalidation.naukri.com/file/download?..."} }
-                resp_json = response.json()
+                resp_json = self._json(response)
 
                 if not isinstance(resp_json, dict) or not resp_json:
-                    print("Unexpected response structure.")
+                    logger.warning("Unexpected response structure.")
                     return None
 
                 file_key = next(iter(resp_json.keys()))
-                print(f"Upload successful")
+                logger.info("Upload successful")
 
-                profile_data = self.get_profile()
+                if profile_future is not None:
+                    profile_future.result()
                 
-                if not profile_data['profile'][0]['profileId']:
-                    print("Profile ID missing in response.")
+                if not self.profile_id:
+                    logger.warning("Profile ID missing in response.")
                     return False
                 
-                return self.update_resume(file_key=file_key, profile_id=profile_data['profile'][0]['profileId'])
+                return self.update_resume(file_key=file_key, profile_id=self.profile_id)
 
         except FileNotFoundError:
-            print(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             return None
-        except requests.RequestException as e:
-            print(f"Upload failed: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Upload failed: %s", e)
             return None
     
     def update_resume(self, file_key, profile_id):
@@ -174,7 +398,7 @@ class NaukriAPIClient:
             bool: True if resume update is successful, else False.
         """
 
-        url = f"{self.base_url}/cloudgateway-mynaukri/resman-aggregator-services/v0/users/self/profiles/{profile_id}/advResume"
+        url = self._url_adv_resume_tmpl.format(pid=profile_id)
 
         payload = {
             "textCV": {
@@ -184,28 +408,29 @@ class NaukriAPIClient:
             }
         }
 
+        # Only the deltas from the session defaults
         headers = {
             "appid": "135",
             "systemid": "135",
-            "Content-Type": "application/json",
             "x-http-method-override": "PUT",
             "x-requested-with": "XMLHttpRequest"
         }
 
         try:
-            print(f"Updating resume for profile: {profile_id}")
-            response = self.session.post(url, headers=headers, json=payload)
+            logger.info("Updating resume for profile: %s", profile_id)
+            response = self._request("update", "POST", url, headers=headers, data=orjson.dumps(payload))
             response.raise_for_status()
 
             if response.status_code == 200:
-                print("Resume updated successfully.")
+                self._invalidate_profile_cache()
+                logger.info("Resume updated successfully.")
                 return True
             else:
-                print(f"Resume update failed: {response.status_code}")
+                logger.warning("Resume update failed: %s", response.status_code)
                 return False
 
         except requests.RequestException as e:
-            print(f"Resume update error: {e}")
+            logger.error("Resume update error: %s", e)
             return False
         
     def refresh_resume_headline(self):
@@ -219,27 +444,25 @@ class NaukriAPIClient:
         """
 
         # Step 1️⃣ - Get profile info to extract profileId and current headline
-        profile_data = self.get_profile()
-        profile_list = profile_data.get("profile", [])
-        if not profile_list:
-            print("⚠️ No profile data found.")
+        profile = self.get_profile_view()
+        if not profile:
+            logger.warning("No profile data found.")
             return False
 
-        profile = profile_list[0]
-        profile_id = profile.get("profileId")
-        current_headline = profile.get("resumeHeadline")
+        profile_id = profile.profile_id
+        current_headline = profile.headline
 
         if not profile_id or not current_headline:
-            print("⚠️ Missing profileId or resumeHeadline in response.")
+            logger.warning("Missing profileId or resumeHeadline in response.")
             return False
 
-        print(f"📝 Current headline: {current_headline}")
+        logger.info("Current headline: %s", current_headline)
 
-        url = f"{self.base_url}/cloudgateway-mynaukri/resman-aggregator-services/v1/users/self/fullprofiles"
+        url = self._url_fullprofiles
+        # Only the deltas from the session defaults
         headers = {
             "appid": "135",
             "systemid": "Naukri",
-            "Content-Type": "application/json",
             "x-http-method-override": "PUT",
             "x-requested-with": "XMLHttpRequest"
         }
@@ -253,13 +476,18 @@ class NaukriAPIClient:
         }
 
         try:
-            print("🔄 Step 1: Adding 'unix timestamp' to refresh headline...")
-            print(f"New Headline : {headline_with_ts}")
+            logger.info("Step 1: Adding 'unix timestamp' to refresh headline...")
+            logger.debug("New Headline : %s", headline_with_ts)
             
-            resp_add = self.session.post(url, headers=headers, json=payload_add)
+            # Prepare once; the revert below only swaps the body
+            prepared = self.session.prepare_request(
+                requests.Request("POST", url, headers=headers, data=orjson.dumps(payload_add))
+            )
+            resp_add = self._send("update", prepared)
             resp_add.raise_for_status()
+            self._invalidate_profile_cache()
             if resp_add.status_code != 200:
-                print(f"⚠️ Failed to update headline (add '.'). Status: {resp_add.status_code}")
+                logger.warning("Failed to update headline (add '.'). Status: %s", resp_add.status_code)
                 return False
 
             # Step 3️⃣ - Remove '.' and revert to original headline
@@ -268,24 +496,77 @@ class NaukriAPIClient:
                 "profileId": profile_id
             }
 
-            print("🔁 Step 2: Reverting headline to original...")
-            resp_revert = self.session.post(url, headers=headers, json=payload_revert)
+            logger.info("Step 2: Reverting headline to original...")
+            prepared.body = orjson.dumps(payload_revert)
+            prepared.headers["Content-Length"] = str(len(prepared.body))
+            # Pick up any cookies rotated by the first call
+            prepared.headers.pop("Cookie", None)
+            prepared.prepare_cookies(self.session.cookies)
+            resp_revert = self._send("update", prepared)
             resp_revert.raise_for_status()
             if resp_revert.status_code == 200:
-                print("✅ Resume headline refreshed successfully.")
+                logger.info("Resume headline refreshed successfully.")
                 return True
             else:
-                print(f"⚠️ Failed to revert headline. Status: {resp_revert.status_code}")
+                logger.warning("Failed to revert headline. Status: %s", resp_revert.status_code)
                 return False
 
         except requests.RequestException as e:
-            print(f"❌ Error refreshing headline: {e}")
+            logger.error("Error refreshing headline: %s", e)
             return False
                 
     # ----------------------------------------------------------------
     # INTERNAL HELPERS
     # ----------------------------------------------------------------
 
+    def _request(self, family, method, url, **kwargs):
+        """Build a request with the session defaults and hand it to _send()."""
+        prepared = self.session.prepare_request(requests.Request(method, url, **kwargs))
+        return self._send(family, prepared)
+
+    def _send(self, family, prepared):
+        """
+        Send a PreparedRequest through the session, throttled by the token
+        bucket for its endpoint family. Each 429 feeds its Retry-After (capped
+        like the adapter's) into the bucket, which defers the resend and every
+        other caller sharing it. After _max_throttled_attempts the 429 is
+        returned to the caller.
+        """
+        bucket = self._rate_limits[family]
+        if family != "login":
+            self._used_since_refresh = True
+        # Same environment handling as Session.request (HTTP(S)_PROXY etc.)
+        settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+
+        for attempt in range(self._max_throttled_attempts):
+            bucket.acquire()
+            resp = self.session.send(prepared, **settings)
+            if resp.status_code != 429:
+                break
+
+            try:
+                retry_after = Retry().parse_retry_after(resp.headers["Retry-After"])
+            except Exception:
+                retry_after = 2 ** attempt
+            retry_after = min(retry_after, CappedRetry.RETRY_AFTER_CAP)
+            logger.warning("Rate limited on %s, backing off for %ss", family, retry_after)
+            bucket.throttled(retry_after)
+
+        if resp.ok:
+            bucket.succeeded()
+        return resp
+
+    @staticmethod
+    def _json(resp):
+        """Raise on HTTP errors, then decode the body with orjson."""
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def _invalidate_profile_cache(self):
+        """Drop the cached profile so the next get_profile() hits the API."""
+        self._profile_cache = None
+        self._profile_cache_ts = 0
+
     def _set_cookies_from_json(self, cookie_list):
         """Add cookies from API response JSON into the session."""
         for c in cookie_list:
@@ -307,46 +588,183 @@ class NaukriAPIClient:
                 "expiry": int(time.time()) + 3600  # fallback 1-hour expiry if not provided
             })
 
-        with open(self.cookie_file, "w") as f:
-            json.dump(cookies_dict, f, indent=2)
-
-        print(f"Cookies saved to {self.cookie_file}")
+        # Write to a uniquely named temp file and swap it in, so a crash
+        # mid-write never leaves a truncated cookie file behind and
+        # concurrent saves don't clobber each other's temp file
+        fd, tmp_file = tempfile.mkstemp(
+            dir=self.cookie_file.parent, prefix=self.cookie_file.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(cookies_dict, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cookie_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+        self._cookie_expiry_min = self._min_cookie_expiry(cookies_dict)
+        self._schedule_cookie_refresh()
+
+        logger.debug("Cookies saved to %s", self.cookie_file)
 
     def _load_cookies(self):
         """Load cookies from local JSON file if present."""
         if not self.cookie_file.exists():
             return
         try:
-            with open(self.cookie_file, "r") as f:
-                cookies_dict = json.load(f)
+            with open(self.cookie_file, "rb") as f:
+                cookies_dict = orjson.loads(f.read())
             self._set_cookies_from_json(cookies_dict)
-            print(f"Loaded cookies from {self.cookie_file}")
+            self._cookie_expiry_min = self._min_cookie_expiry(cookies_dict)
+            logger.debug("Loaded cookies from %s", self.cookie_file)
+            if self._is_cookie_expired():
+                logger.info("Saved cookies expire at %s, login required", self._cookie_expiry_min)
+            else:
+                self._schedule_cookie_refresh()
+        except orjson.JSONDecodeError as e:
+            logger.warning("Cookie file %s is corrupt, ignoring it: %s", self.cookie_file, e)
         except Exception as e:
-            print(f"Could not load cookies: {e}")
+            logger.warning("Could not load cookies: %s", e)
+
+    @staticmethod
+    def _min_cookie_expiry(cookie_list):
+        """Earliest non-zero expiry in a cookie list, or 0 if there is none."""
+        return min((c["expiry"] for c in cookie_list if c.get("expiry")), default=0)
 
     def _is_cookie_expired(self):
-        """Check if saved cookies are expired."""
-        if not self.cookie_file.exists():
-            return True
-        try:
-            with open(self.cookie_file, "r") as f:
-                cookies = json.load(f)
-            now = int(time.time())
-            for c in cookies:
-                exp = c.get("expiry", 0)
-                if exp and exp < now:
-                    print(f"Cookie {c['name']} expired at {exp}")
-                    return True
-            return False
-        except Exception as e:
-            print(f"Could not check cookie expiry: {e}")
-            return True
+        """
+        Check if saved cookies are expired, or will be within the refresh margin
+        (uses the expiry cached at load/save).
+        """
+        return (
+            not self._cookie_expiry_min
+            or self._cookie_expiry_min - self._refresh_margin < int(time.time())
+        )
+
+    def _schedule_cookie_refresh(self):
+        """
+        Arm a background timer that re-logs in shortly before request paths
+        would start treating the cookies as expired.
+        """
+        self._cancel_cookie_refresh()
+        delay = self._cookie_expiry_min - 2 * self._refresh_margin - time.time()
+        if delay <= 0:
+            return
+        self._refresh_timer = threading.Timer(
+            delay, self._background_login, args=(self._cookie_expiry_min,)
+        )
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _cancel_cookie_refresh(self):
+        """Stop any pending background re-login."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _background_login(self, armed_expiry):
+        """
+        Timer callback: refresh cookies off the request path. An idle client
+        is left alone, so the timer stops re-arming until it is used again.
+        Skipped if the cookies changed since the timer was armed (a foreground
+        login, logout, or another refresh already dealt with them).
+        """
+        with self._login_lock:
+            # Only forget the timer if it is still this one; a login that ran
+            # while we waited for the lock may have armed a newer one
+            if self._refresh_timer is threading.current_thread():
+                self._refresh_timer = None
+            if self._cookie_expiry_min != armed_expiry:
+                logger.debug("Cookies changed since refresh was scheduled, skipping")
+                return
+            if not self._used_since_refresh:
+                logger.debug("Client idle since last login, skipping cookie refresh")
+                return
+            self._used_since_refresh = False
+            try:
+                self.login()
+            except Exception as e:
+                logger.error("Background cookie refresh failed: %s", e)
+
+
+class AsyncNaukriAPIClient:
+    """
+    asyncio front-end for NaukriAPIClient.
+    Each call runs the blocking client method in a worker thread, so several
+    accounts can be driven concurrently with asyncio.gather().
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.client = NaukriAPIClient(*args, **kwargs)
+
+    async def login(self):
+        """Login to Naukri and store cookies."""
+        return await asyncio.to_thread(self.client.login)
+
+    async def logout(self):
+        """Clear cookies and session."""
+        return await asyncio.to_thread(self.client.logout)
+
+    async def close(self):
+        """Stop the background cookie refresh and release pooled connections."""
+        return await asyncio.to_thread(self.client.close)
+
+    async def get_profile(self, force_refresh=False):
+        """Fetch the profile payload; see NaukriAPIClient.get_profile."""
+        return await asyncio.to_thread(self.client.get_profile, force_refresh)
+
+    async def get_profile_view(self, force_refresh=False):
+        """Fetch the profile as a ProfileView; see NaukriAPIClient.get_profile_view."""
+        return await asyncio.to_thread(self.client.get_profile_view, force_refresh)
+
+    async def upload_resume(self, file_path):
+        """Upload a resume file and attach it to the profile."""
+        return await asyncio.to_thread(self.client.upload_resume, file_path)
+
+    async def update_resume(self, file_key, profile_id):
+        """Point the profile's resume at an already uploaded file."""
+        return await asyncio.to_thread(self.client.update_resume, file_key, profile_id)
+
+    async def refresh_resume_headline(self):
+        """Bump the resume headline to trigger a profile refresh."""
+        return await asyncio.to_thread(self.client.refresh_resume_headline)
+
+
+def batch_refresh_headlines(clients, max_workers=8):
+    """
+    Refresh resume headlines for several accounts concurrently.
+
+    Args:
+        clients (list[NaukriAPIClient]): One client (and session) per account.
+            Each client needs its own cookie_file; the default "cookies.json"
+            would have every login overwrite the other accounts' cookies.
+        max_workers (int): Upper bound on concurrent refreshes.
+
+    Returns:
+        list[Future]: Completed futures in the same order as clients; call
+        .result() to get each refresh outcome or re-raise its exception.
+
+    Raises:
+        ValueError: If two clients share a cookie file.
+    """
+    if len({c.cookie_file.resolve() for c in clients}) != len(clients):
+        raise ValueError("❌ Each client in a batch needs its own cookie_file.")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(c.refresh_resume_headline) for c in clients]
+    return futures
 
 
 # ----------------------------------------------------------------
 # Example usage
 # ----------------------------------------------------------------
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     client = NaukriAPIClient()
 
     # Make sure logged in
@@ -1,5 +1,6 @@
 from main import NaukriAPIClient
 import argparse
+import logging
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Naukri.com Automation Client")
@@ -11,6 +12,8 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Initialize client (CLI flags override .env)
     client = NaukriAPIClient(username=args.user, password=args.password)
 